@@ -9,11 +9,37 @@ import os
 import typing
 
 import mpi4py.MPI
+import numpy as np
+import numpy.typing
 import petsc4py.PETSc
 
 from rbnicsx.io import on_rank_zero
 
 
+def export_array(  # type: ignore[no-any-unimported]
+    array: np.typing.NDArray[petsc4py.PETSc.ScalarType], comm: mpi4py.MPI.Intracomm, directory: str, filename: str
+) -> None:
+    """
+    Export a dense numpy array to a .npy file.
+
+    Parameters
+    ----------
+    array
+        Array to be exported.
+    comm
+        Communicator whose rank zero will write the file.
+    directory
+        Directory where to export the array.
+    filename
+        Name of the file where to export the array.
+    """
+    os.makedirs(directory, exist_ok=True)
+
+    def write_array() -> None:
+        np.save(os.path.join(directory, filename + ".npy"), array)
+    on_rank_zero(comm, write_array)
+
+
 def export_matrix(  # type: ignore[no-any-unimported]
     mat: petsc4py.PETSc.Mat, comm: mpi4py.MPI.Intracomm, directory: str, filename: str
 ) -> None:
@@ -62,12 +88,11 @@ def export_matrices(  # type: ignore[no-any-unimported]
             length_file.write(str(len(mats)))
     on_rank_zero(comm, write_length)
 
-    # Write out the list
-    for (index, mat) in enumerate(mats):
-        viewer = petsc4py.PETSc.Viewer().createBinary(
-            os.path.join(directory, filename, str(index) + ".dat"), "w", comm)
+    # Write out the list, appending all entries to the same file
+    viewer = petsc4py.PETSc.Viewer().createBinary(os.path.join(directory, filename, "list.dat"), "w", comm)
+    for mat in mats:
         viewer.view(mat)
-        viewer.destroy()
+    viewer.destroy()
 
 
 def export_vector(  # type: ignore[no-any-unimported]
@@ -118,9 +143,8 @@ def export_vectors(  # type: ignore[no-any-unimported]
             length_file.write(str(len(vecs)))
     on_rank_zero(comm, write_length)
 
-    # Write out the list
-    for (index, vec) in enumerate(vecs):
-        viewer = petsc4py.PETSc.Viewer().createBinary(
-            os.path.join(directory, filename, str(index) + ".dat"), "w", comm)
+    # Write out the list, appending all entries to the same file
+    viewer = petsc4py.PETSc.Viewer().createBinary(os.path.join(directory, filename, "list.dat"), "w", comm)
+    for vec in vecs:
         viewer.view(vec)
-        viewer.destroy()
+    viewer.destroy()
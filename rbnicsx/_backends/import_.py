@@ -9,11 +9,104 @@ import os
 import typing
 
 import mpi4py.MPI
+import numpy as np
+import numpy.typing
 import petsc4py.PETSc
 
 from rbnicsx.io import on_rank_zero
 
 
+def import_array(  # type: ignore[no-any-unimported]
+    comm: mpi4py.MPI.Intracomm, directory: str, filename: str
+) -> typing.Optional[np.typing.NDArray[petsc4py.PETSc.ScalarType]]:
+    """
+    Import a dense numpy array from a .npy file, if available.
+
+    The file is read on rank zero only, and its content is then broadcast to all ranks as a raw buffer.
+
+    Parameters
+    ----------
+    comm
+        Communicator whose rank zero will read the file.
+    directory
+        Directory where to import the array from.
+    filename
+        Name of the file where to import the array from.
+
+    Returns
+    -------
+    :
+        Array imported from file, or None if no .npy file is available.
+    """
+    arrays = list()
+
+    def read_array() -> typing.Optional[typing.Tuple[typing.Tuple[int, ...], str]]:
+        path = os.path.join(directory, filename + ".npy")
+        if os.path.isfile(path):
+            arrays.append(np.ascontiguousarray(np.load(path)))
+            return arrays[0].shape, arrays[0].dtype.str
+        else:
+            return None
+
+    # Only broadcast the shape and type of the array with pickle, to allocate the receiving buffers
+    shape_and_dtype = on_rank_zero(comm, read_array)
+    if shape_and_dtype is None:
+        return None
+    else:
+        array = arrays[0] if comm.rank == 0 else np.empty(*shape_and_dtype)
+        comm.Bcast(array, root=0)
+        return array
+
+
+def list_viewers(  # type: ignore[no-any-unimported]
+    comm: mpi4py.MPI.Intracomm, directory: str, filename: str
+) -> typing.Iterator[petsc4py.PETSc.Viewer]:
+    """
+    Iterate over the entries of a list exported to file, providing a viewer from which to load each entry.
+
+    Lists are stored in a single file, while lists exported by earlier versions store each entry in a separate
+    file: the latter layout is used when the single file is not available.
+
+    Parameters
+    ----------
+    comm
+        Communicator to be used while creating the viewers.
+    directory
+        Directory where to import the list from.
+    filename
+        Name of the file where to import the list from.
+
+    Returns
+    -------
+    :
+        An iterator over the entries of the list, which yields a viewer positioned at the beginning of each entry.
+    """
+    # Read in length of the list
+    def read_length() -> int:
+        with open(os.path.join(directory, filename, "length.dat"), "r") as length_file:
+            return int(length_file.readline())
+    length = on_rank_zero(comm, read_length)
+
+    # Read in the list, loading all entries from the same file if available. Viewers are destroyed even if
+    # the caller fails while loading an entry, or stops iterating early
+    list_path = os.path.join(directory, filename, "list.dat")
+    if on_rank_zero(comm, lambda: os.path.isfile(list_path)):
+        viewer = petsc4py.PETSc.Viewer().createBinary(list_path, "r", comm)
+        try:
+            for _ in range(length):
+                yield viewer
+        finally:
+            viewer.destroy()
+    else:
+        for index in range(length):
+            viewer = petsc4py.PETSc.Viewer().createBinary(
+                os.path.join(directory, filename, str(index) + ".dat"), "r", comm)
+            try:
+                yield viewer
+            finally:
+                viewer.destroy()
+
+
 def import_matrix(  # type: ignore[no-any-unimported]
     allocate: typing.Callable[[], petsc4py.PETSc.Mat], comm: mpi4py.MPI.Intracomm, directory: str, filename: str
 ) -> petsc4py.PETSc.Mat:
@@ -65,21 +158,11 @@ def import_matrices(  # type: ignore[no-any-unimported]
     :
         Matrices imported from file.
     """
-    # Read in length of the list
-    def read_length() -> int:
-        with open(os.path.join(directory, filename, "length.dat"), "r") as length_file:
-            return int(length_file.readline())
-    length = on_rank_zero(comm, read_length)
-
-    # Read in the list
     mats = list()
-    for index in range(length):
-        viewer = petsc4py.PETSc.Viewer().createBinary(
-            os.path.join(directory, filename, str(index) + ".dat"), "r", comm)
+    for viewer in list_viewers(comm, directory, filename):
         mat = allocate()
         mat.load(viewer)
         mats.append(mat)
-        viewer.destroy()
     return mats
 
 
@@ -134,19 +217,9 @@ def import_vectors(  # type: ignore[no-any-unimported]
     :
         Vectors imported from file.
     """
-    # Read in length of the list
-    def read_length() -> int:
-        with open(os.path.join(directory, filename, "length.dat"), "r") as length_file:
-            return int(length_file.readline())
-    length = on_rank_zero(comm, read_length)
-
-    # Read in the list
     vecs = list()
-    for index in range(length):
-        viewer = petsc4py.PETSc.Viewer().createBinary(
-            os.path.join(directory, filename, str(index) + ".dat"), "r", comm)
+    for viewer in list_viewers(comm, directory, filename):
         vec = allocate()
         vec.load(viewer)
         vecs.append(vec)
-        viewer.destroy()
     return vecs
@@ -32,12 +32,7 @@ def create_online_vector(N: int) -> petsc4py.PETSc.Vec:  # type: ignore[no-any-u
         Allocated online vector.
     """
     vec = petsc4py.PETSc.Vec().createSeq(N, comm=mpi4py.MPI.COMM_SELF)
-    # Attach the identity local-to-global map
-    lgmap = petsc4py.PETSc.LGMap().create(np.arange(N, dtype=np.int32), comm=vec.comm)
-    vec.setLGMap(lgmap)
-    lgmap.destroy()
-    # Setup and return
-    vec.setUp()
+    _set_up_online_vector(vec)
     return vec
 
 
@@ -73,14 +68,7 @@ def create_online_matrix(M: int, N: int) -> petsc4py.PETSc.Mat:  # type: ignore[
         Allocated online matrix.
     """
     mat = petsc4py.PETSc.Mat().createDense((M, N), comm=mpi4py.MPI.COMM_SELF)
-    # Attach the identity local-to-global map
-    row_lgmap = petsc4py.PETSc.LGMap().create(np.arange(M, dtype=np.int32), comm=mat.comm)
-    col_lgmap = petsc4py.PETSc.LGMap().create(np.arange(N, dtype=np.int32), comm=mat.comm)
-    mat.setLGMap(row_lgmap, col_lgmap)
-    row_lgmap.destroy()
-    col_lgmap.destroy()
-    # Setup and return
-    mat.setUp()
+    _set_up_online_matrix(mat)
     return mat
 
 
@@ -103,6 +91,143 @@ def create_online_matrix_block(  # type: ignore[no-any-unimported]
     return create_online_matrix(sum(M), sum(N))
 
 
+def stack_online_vectors(  # type: ignore[no-any-unimported]
+    vectors: typing.Iterable[petsc4py.PETSc.Vec]
+) -> np.typing.NDArray[petsc4py.PETSc.ScalarType]:
+    """
+    Copy the content of a collection of online vectors into a dense array.
+
+    Parameters
+    ----------
+    vectors
+        Online vectors, all of the same dimension.
+
+    Returns
+    -------
+    :
+        Dense array collecting the content of the online vectors by columns.
+    """
+    return np.column_stack([vec.array for vec in vectors])
+
+
+def wrap_online_vectors(  # type: ignore[no-any-unimported]
+    array: np.typing.NDArray[petsc4py.PETSc.ScalarType]
+) -> typing.List[petsc4py.PETSc.Vec]:
+    """
+    Wrap each column of a dense array into an online vector.
+
+    The dense array is copied at most once into column-major storage, and then each online vector
+    is created on top of the corresponding column without any further copy.
+
+    Parameters
+    ----------
+    array
+        Dense array collecting the content of the online vectors by columns.
+
+    Returns
+    -------
+    :
+        Online vectors sharing their storage with a column-major copy of the input array.
+    """
+    array = np.asfortranarray(array, dtype=petsc4py.PETSc.ScalarType)
+    vectors = list()
+    for n in range(array.shape[1]):
+        vec = petsc4py.PETSc.Vec().createWithArray(array[:, n], comm=mpi4py.MPI.COMM_SELF)
+        _set_up_online_vector(vec)
+        vectors.append(vec)
+    return vectors
+
+
+def wrap_online_matrices(  # type: ignore[no-any-unimported]
+    array: np.typing.NDArray[petsc4py.PETSc.ScalarType]
+) -> typing.List[petsc4py.PETSc.Mat]:
+    """
+    Wrap each slice of a dense three-dimensional array into an online matrix.
+
+    The dense array is copied once into a single contiguous storage, laid out so that each slice is in
+    column-major order, and then each online matrix is created on top of the corresponding slice without
+    any further copy.
+
+    Parameters
+    ----------
+    array
+        Dense array of shape (k, M, N) collecting the content of k online matrices of dimension M x N.
+
+    Returns
+    -------
+    :
+        Online matrices sharing their storage with a column-major copy of the input array.
+    """
+    (K, M, N) = array.shape
+    storage = np.empty((K, N, M), dtype=petsc4py.PETSc.ScalarType)
+    storage[:] = np.swapaxes(array, 1, 2)
+    matrices = list()
+    for k in range(K):
+        mat = petsc4py.PETSc.Mat().createDense((M, N), array=storage[k].reshape(-1), comm=mpi4py.MPI.COMM_SELF)
+        _set_up_online_matrix(mat)
+        mat.assemble()
+        matrices.append(mat)
+    return matrices
+
+
+def _set_up_online_vector(vec: petsc4py.PETSc.Vec) -> None:  # type: ignore[no-any-unimported]
+    """
+    Attach the identity local-to-global map to a newly created online vector, and set it up.
+
+    Parameters
+    ----------
+    vec
+        Newly created online vector.
+    """
+    # Attach the identity local-to-global map
+    lgmap = petsc4py.PETSc.LGMap().create(np.arange(vec.getSize(), dtype=np.int32), comm=vec.comm)
+    vec.setLGMap(lgmap)
+    lgmap.destroy()
+    # Setup
+    vec.setUp()
+
+
+def _set_up_online_matrix(mat: petsc4py.PETSc.Mat) -> None:  # type: ignore[no-any-unimported]
+    """
+    Attach the identity local-to-global maps to a newly created online matrix, and set it up.
+
+    Parameters
+    ----------
+    mat
+        Newly created online matrix.
+    """
+    (M, N) = mat.getSize()
+    # Attach the identity local-to-global map
+    row_lgmap = petsc4py.PETSc.LGMap().create(np.arange(M, dtype=np.int32), comm=mat.comm)
+    col_lgmap = petsc4py.PETSc.LGMap().create(np.arange(N, dtype=np.int32), comm=mat.comm)
+    mat.setLGMap(row_lgmap, col_lgmap)
+    row_lgmap.destroy()
+    col_lgmap.destroy()
+    # Setup
+    mat.setUp()
+
+
+def _split_block_indices(N: typing.List[int]) -> typing.List[np.typing.NDArray[np.int32]]:
+    """
+    Split the indices of an online tensor into the indices of each of its blocks.
+
+    Parameters
+    ----------
+    N
+        Dimension of the blocks.
+
+    Returns
+    -------
+    :
+        Indices of each block, as views of a single contiguous array.
+    """
+    if len(N) == 0:
+        return []
+    else:
+        block_offsets = np.cumsum(np.asarray(N, dtype=np.int32))
+        return np.split(np.arange(block_offsets[-1], dtype=np.int32), block_offsets[:-1])
+
+
 class VecSubVectorWrapper(typing.ContextManager[petsc4py.PETSc.Vec]):  # type: ignore[no-any-unimported]
     """
     Wrap calls to petsc4py.PETSc.Vec.{getSubVector,restoreSubVector} in a context manager.
@@ -191,8 +316,7 @@ def BlockVecSubVectorContextManager(
 
         def __init__(self, b: petsc4py.PETSc.Vec, N: typing.List[int]) -> None:  # type: ignore[no-any-unimported]
             self._b = b
-            blocks = np.hstack((0, np.cumsum([N_ for N_ in N]))).astype(np.int32)
-            self._indices = [np.arange(blocks[i], blocks[i + 1], dtype=np.int32) for i in range(len(N))]
+            self._indices = _split_block_indices(N)
 
         def __iter__(self) -> typing.Iterator[petsc4py.PETSc.Vec]:  # type: ignore[no-any-unimported]
             """Iterate over blocks."""
@@ -341,10 +465,8 @@ def BlockMatSubMatrixContextManager(
             self, A: petsc4py.PETSc.Mat, M: typing.List[int], N: typing.List[int]
         ) -> None:
             self._A = A
-            row_blocks = np.hstack((0, np.cumsum([M_ for M_ in M])))
-            col_blocks = np.hstack((0, np.cumsum([N_ for N_ in N])))
-            self._row_indices = [np.arange(row_blocks[i], row_blocks[i + 1], dtype=np.int32) for i in range(len(M))]
-            self._col_indices = [np.arange(col_blocks[j], col_blocks[j + 1], dtype=np.int32) for j in range(len(N))]
+            self._row_indices = _split_block_indices(M)
+            self._col_indices = _split_block_indices(N)
 
         def __iter__(self) -> typing.Iterator[  # type: ignore[no-any-unimported]
                 typing.Tuple[int, int, petsc4py.PETSc.Mat]]:
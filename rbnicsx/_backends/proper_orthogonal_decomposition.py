@@ -10,10 +10,10 @@ import typing
 import numpy as np
 import numpy.typing
 import petsc4py.PETSc
-import slepc4py.SLEPc
+import scipy.linalg
 
 from rbnicsx._backends.functions_list import Function, FunctionsList
-from rbnicsx._backends.online_tensors import create_online_matrix, create_online_vector
+from rbnicsx._backends.online_tensors import create_online_vector
 from rbnicsx._backends.tensors_list import TensorsList
 from rbnicsx._cpp import cpp_library
 
@@ -179,7 +179,7 @@ def proper_orthogonal_decomposition_tensors(  # type: ignore[no-any-unimported]
             tensor_j: petsc4py.PETSc.Vec
         ) -> typing.Callable[[petsc4py.PETSc.Vec], petsc4py.PETSc.RealType]:
             def _(tensor_i: petsc4py.PETSc.Vec) -> petsc4py.PETSc.RealType:  # type: ignore[no-any-unimported]
-                return tensor_i.dot(tensor_j)
+                return tensor_j.dot(tensor_i)
 
             return _
 
@@ -243,42 +243,19 @@ def _solve_eigenvalue_problem(  # type: ignore[no-any-unimported]
             3. Eigenvectors of the correlation matrix. Only the first few eigenvectors are returned, till
                either the maximum number N is reached or the tolerance on the retained energy is fulfilled.
     """
-    correlation_matrix = create_online_matrix(len(snapshots), len(snapshots))
+    correlation_matrix = np.zeros((len(snapshots), len(snapshots)), dtype=petsc4py.PETSc.ScalarType)
     for (j, snapshot_j) in enumerate(snapshots):
         compute_inner_product_partial_j = compute_inner_product(snapshot_j)
         for (i, snapshot_i) in enumerate(snapshots):
             correlation_matrix[i, j] = compute_inner_product_partial_j(snapshot_i)
-    correlation_matrix.assemble()
-
-    eps = slepc4py.SLEPc.EPS().create(correlation_matrix.comm)
-    eps.setType(slepc4py.SLEPc.EPS.Type.LAPACK)
-    eps.setProblemType(slepc4py.SLEPc.EPS.ProblemType.HEP)
-    eps.setWhichEigenpairs(slepc4py.SLEPc.EPS.Which.LARGEST_REAL)
-    eps.setFromOptions()
-    eps.setOperators(correlation_matrix)
-    eps.solve()
-
-    eigenvalues = list()
-    for n in range(eps.getConverged()):
-        eigenvalue_n = eps.getEigenvalue(n)
-        assert np.isclose(eigenvalue_n.imag, 0.0)
-        eigenvalues.append(eigenvalue_n.real)
-
-    total_energy = sum([abs(e) for e in eigenvalues])
-    retained_energy = np.cumsum([abs(e) for e in eigenvalues])
-    if total_energy > 0.0:
-        retained_energy = np.array([retained_energy_n / total_energy for retained_energy_n in retained_energy])
-    else:
-        retained_energy = np.ones(eps.getConverged())  # trivial case, all snapshots are zero
 
-    N = min(N, eps.getConverged())
+    eigenvalues, eigenvectors_array = solve_correlation_eigenvalue_problem(correlation_matrix, N, tol)
+
     eigenvectors = list()
-    for n in range(N):
-        eigenvector_n = create_online_vector(correlation_matrix.size[0])
-        eps.getEigenvector(n, eigenvector_n)
+    for n in range(eigenvectors_array.shape[1]):
+        eigenvector_n = create_online_vector(len(eigenvalues))
+        eigenvector_n.array[:] = eigenvectors_array[:, n]
         eigenvectors.append(eigenvector_n)
-        if tol > 0.0 and retained_energy[n] > 1.0 - tol:
-            break
 
     modes = list()
     for eigenvector_n in eigenvectors:
@@ -289,4 +266,120 @@ def _solve_eigenvalue_problem(  # type: ignore[no-any-unimported]
                 scale(mode_n, 1.0 / norm_n)
         modes.append(mode_n)
 
-    return np.array(eigenvalues), modes, eigenvectors
+    return eigenvalues, modes, eigenvectors
+
+
+def solve_correlation_eigenvalue_problem(  # type: ignore[no-any-unimported]
+    correlation_matrix: np.typing.NDArray[petsc4py.PETSc.ScalarType], N: int, tol: petsc4py.PETSc.RealType,
+    mixed_precision: bool = False
+) -> typing.Tuple[np.typing.NDArray[petsc4py.PETSc.RealType], np.typing.NDArray[petsc4py.PETSc.ScalarType]]:
+    """
+    Solve the eigenvalue problem for a dense correlation matrix.
+
+    The (i, j) entry of the correlation matrix is expected to be the inner product of the j-th snapshot
+    against the i-th snapshot, conjugated in complex arithmetic, i.e. X^H A X in matrix form, so that the modes
+    are obtained by combining the snapshots with the entries of the eigenvectors. The arbitrary phase of each
+    eigenvector is fixed so that its entry of largest magnitude is real and positive.
+
+    Parameters
+    ----------
+    correlation_matrix
+        Dense hermitian correlation matrix.
+    N
+        Maximum number of eigenvectors to be returned.
+    tol
+        Tolerance on the retained energy.
+    mixed_precision
+        If true, the eigenvalue problem is solved in single precision, and the retained eigenpairs are then
+        refined in the precision of the correlation matrix by a Rayleigh-Ritz projection. If false (default),
+        the eigenvalue problem is solved in the precision of the correlation matrix.
+
+    Returns
+    -------
+    :
+        A tuple containing:
+            1. Eigenvalues of the correlation matrix, largest first. All computed eigenvalues are returned.
+            2. Dense array collecting by columns the eigenvectors of the correlation matrix. Only the first
+               few eigenvectors are returned, till either the maximum number N is reached or the tolerance
+               on the retained energy is fulfilled.
+    """
+    if mixed_precision:
+        single_precision_type = np.complex64 if np.iscomplexobj(correlation_matrix) else np.float32
+        eigensolver_matrix = correlation_matrix.astype(single_precision_type)
+    else:
+        eigensolver_matrix = correlation_matrix
+
+    # The correlation matrix is hermitian: use the MRRR driver of LAPACK, which returns eigenvalues in
+    # ascending order, and then flip the eigenpairs to have the largest eigenvalues first.
+    eigenvalues, eigenvectors_array = scipy.linalg.eigh(eigensolver_matrix, driver="evr")
+    eigenvalues = eigenvalues[::-1].astype(correlation_matrix.real.dtype)
+    eigenvectors_array = eigenvectors_array[:, ::-1].astype(correlation_matrix.dtype)
+    N = count_retained_modes(eigenvalues, N, tol)
+    eigenvectors_array = eigenvectors_array[:, :N]
+
+    if mixed_precision and N > 0:
+        # Refine the retained eigenpairs by a Rayleigh-Ritz projection of the correlation matrix onto the subspace
+        # spanned by the eigenvectors computed in single precision
+        eigenvectors_array, _ = np.linalg.qr(eigenvectors_array)
+        ritz_values, ritz_vectors = scipy.linalg.eigh(
+            eigenvectors_array.conj().T @ correlation_matrix @ eigenvectors_array)
+        eigenvalues[:N] = ritz_values[::-1]
+        eigenvectors_array = eigenvectors_array @ ritz_vectors[:, ::-1]
+    return eigenvalues, fix_eigenvectors_phase(eigenvectors_array)
+
+
+def fix_eigenvectors_phase(  # type: ignore[no-any-unimported]
+    eigenvectors_array: np.typing.NDArray[petsc4py.PETSc.ScalarType]
+) -> np.typing.NDArray[petsc4py.PETSc.ScalarType]:
+    """
+    Fix the arbitrary phase of eigenvectors so that the entry of largest magnitude of each one is real and positive.
+
+    Parameters
+    ----------
+    eigenvectors_array
+        Dense array collecting the eigenvectors by columns.
+
+    Returns
+    -------
+    :
+        Dense array collecting by columns the eigenvectors with fixed phase.
+    """
+    largest_entries = eigenvectors_array[
+        np.argmax(np.abs(eigenvectors_array), axis=0), np.arange(eigenvectors_array.shape[1])]
+    return eigenvectors_array * (np.abs(largest_entries) / largest_entries)  # type: ignore[no-any-return]
+
+
+def count_retained_modes(  # type: ignore[no-any-unimported]
+    eigenvalues: np.typing.NDArray[petsc4py.PETSc.RealType], N: int, tol: petsc4py.PETSc.RealType
+) -> int:
+    """
+    Count the number of modes to be retained by the proper orthogonal decomposition.
+
+    Parameters
+    ----------
+    eigenvalues
+        Eigenvalues of the correlation matrix, largest first.
+    N
+        Maximum number of modes to be retained.
+    tol
+        Tolerance on the retained energy.
+
+    Returns
+    -------
+    :
+        Number of modes to be retained, till either the maximum number N is reached or the tolerance
+        on the retained energy is fulfilled.
+    """
+    total_energy = np.sum(np.abs(eigenvalues))
+    retained_energy = np.cumsum(np.abs(eigenvalues))
+    if total_energy > 0.0:
+        retained_energy /= total_energy
+    else:
+        retained_energy = np.ones(len(eigenvalues))  # trivial case, all snapshots are zero
+
+    N = min(N, len(eigenvalues))
+    if tol > 0.0:
+        for n in range(N):
+            if retained_energy[n] > 1.0 - tol:
+                return n + 1
+    return N
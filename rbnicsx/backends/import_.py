@@ -14,8 +14,7 @@ import petsc4py.PETSc
 
 from rbnicsx._backends.import_ import (
     import_matrices as import_matrices_super, import_matrix as import_matrix_super,
-    import_vector as import_vector_super, import_vectors as import_vectors_super)
-from rbnicsx.io import on_rank_zero
+    import_vector as import_vector_super, import_vectors as import_vectors_super, list_viewers)
 
 
 def import_function(function_space: dolfinx.fem.FunctionSpace, directory: str, filename: str) -> dolfinx.fem.Function:
@@ -66,21 +65,11 @@ def import_functions(
     """
     comm = function_space.mesh.comm
 
-    # Read in length of the list
-    def read_length() -> int:
-        with open(os.path.join(directory, filename, "length.dat"), "r") as length_file:
-            return int(length_file.readline())
-    length = on_rank_zero(comm, read_length)
-
-    # Read in the list
     functions = list()
-    for index in range(length):
-        viewer = petsc4py.PETSc.Viewer().createBinary(
-            os.path.join(directory, filename, str(index) + ".dat"), "r", comm)
+    for viewer in list_viewers(comm, directory, filename):
         function = dolfinx.fem.Function(function_space)
         function.vector.load(viewer)
         functions.append(function)
-        viewer.destroy()
     return functions
 
 
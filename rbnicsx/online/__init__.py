@@ -10,7 +10,8 @@ from rbnicsx._backends.online_tensors import (
     BlockMatSubMatrixCopier, BlockMatSubMatrixWrapper, BlockVecSubVectorCopier, BlockVecSubVectorWrapper,
     create_online_matrix as create_matrix, create_online_matrix_block as create_matrix_block,
     create_online_vector as create_vector, create_online_vector_block as create_vector_block, MatSubMatrixCopier,
-    MatSubMatrixWrapper, VecSubVectorCopier, VecSubVectorWrapper)
+    MatSubMatrixWrapper, stack_online_vectors as stack_vectors, VecSubVectorCopier, VecSubVectorWrapper,
+    wrap_online_matrices as wrap_matrices, wrap_online_vectors as wrap_vectors)
 #
 # Import functions and classes defined in this module
 from rbnicsx.online.export import (
@@ -8,11 +8,10 @@
 import typing
 
 import mpi4py.MPI
+import numpy as np
 import petsc4py.PETSc
 
-from rbnicsx._backends.export import (
-    export_matrices as export_matrices_super, export_matrix as export_matrix_super,
-    export_vector as export_vector_super, export_vectors as export_vectors_super)
+from rbnicsx._backends.export import export_array
 
 
 def export_matrix(  # type: ignore[no-any-unimported]
@@ -31,7 +30,7 @@ def export_matrix(  # type: ignore[no-any-unimported]
         Name of the file where to export the matrix.
     """
     assert mat.getType() == petsc4py.PETSc.Mat.Type.SEQDENSE
-    export_matrix_super(mat, mpi4py.MPI.COMM_WORLD, directory, filename)
+    export_array(mat.getDenseArray(), mpi4py.MPI.COMM_WORLD, directory, filename)
 
 
 export_matrix_block = export_matrix
@@ -53,7 +52,9 @@ def export_matrices(  # type: ignore[no-any-unimported]
         Name of the file where to export the matrix.
     """
     assert all([mat.getType() == petsc4py.PETSc.Mat.Type.SEQDENSE for mat in mats])
-    export_matrices_super(mats, mpi4py.MPI.COMM_WORLD, directory, filename)
+    export_array(
+        np.array([mat.getDenseArray() for mat in mats], dtype=petsc4py.PETSc.ScalarType), mpi4py.MPI.COMM_WORLD,
+        directory, filename)
 
 
 export_matrices_block = export_matrices
@@ -75,7 +76,7 @@ def export_vector(  # type: ignore[no-any-unimported]
         Name of the file where to export the vector.
     """
     assert vec.getType() == petsc4py.PETSc.Vec.Type.SEQ
-    export_vector_super(vec, mpi4py.MPI.COMM_WORLD, directory, filename)
+    export_array(vec.array, mpi4py.MPI.COMM_WORLD, directory, filename)
 
 
 export_vector_block = export_vector
@@ -97,7 +98,9 @@ def export_vectors(  # type: ignore[no-any-unimported]
         Name of the file where to export the vector.
     """
     assert all([vec.getType() == petsc4py.PETSc.Vec.Type.SEQ for vec in vecs])
-    export_vectors_super(vecs, mpi4py.MPI.COMM_WORLD, directory, filename)
+    export_array(
+        np.array([vec.array for vec in vecs], dtype=petsc4py.PETSc.ScalarType), mpi4py.MPI.COMM_WORLD,
+        directory, filename)
 
 
 export_vectors_block = export_vectors
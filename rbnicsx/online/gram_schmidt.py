@@ -10,8 +10,8 @@ import typing
 import numpy as np
 import petsc4py.PETSc
 
+from rbnicsx._backends.online_tensors import stack_online_vectors
 from rbnicsx.online.functions_list import FunctionsList
-from rbnicsx.online.projection import matrix_action
 
 
 def gram_schmidt(  # type: ignore[no-any-unimported]
@@ -31,15 +31,23 @@ def gram_schmidt(  # type: ignore[no-any-unimported]
     inner_product
         Online matrix which defines the inner product.
     """
-    compute_inner_product = matrix_action(inner_product)
+    inner_product_array = inner_product.getDenseArray()
 
-    orthonormalized = new_function.copy()
-    for function_n in functions_list:
-        orthonormalized.axpy(
-            - compute_inner_product(function_n)(orthonormalized), function_n)
-    norm = np.sqrt(compute_inner_product(orthonormalized)(orthonormalized))
+    # Operate on numpy views of the online vectors rather than on petsc4py objects
+    orthonormalized_array = new_function.array.copy()
+    if len(functions_list) > 0:
+        # Classical Gram-Schmidt with reorthogonalization: projecting against the whole set at once turns
+        # the loop over the functions into matrix-vector products, while the second pass recovers the
+        # numerical orthogonality of the modified variant
+        functions_array = stack_online_vectors(functions_list)
+        inner_product_functions_array = inner_product_array @ functions_array
+        for _ in range(2):
+            orthonormalized_array -= functions_array @ (
+                inner_product_functions_array.conj().T @ orthonormalized_array)
+    norm = np.sqrt(np.vdot(inner_product_array @ orthonormalized_array, orthonormalized_array))
     if norm != 0.0:
-        orthonormalized *= 1.0 / norm
+        orthonormalized = new_function.duplicate()
+        orthonormalized.array[:] = orthonormalized_array / norm
         functions_list.append(orthonormalized)
 
 
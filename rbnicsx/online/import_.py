@@ -11,11 +11,12 @@ import mpi4py.MPI
 import petsc4py.PETSc
 
 from rbnicsx._backends.import_ import (
-    import_matrices as import_matrices_super, import_matrix as import_matrix_super,
+    import_array, import_matrices as import_matrices_super, import_matrix as import_matrix_super,
     import_vector as import_vector_super, import_vectors as import_vectors_super)
 from rbnicsx._backends.online_tensors import (
     create_online_matrix as create_matrix, create_online_matrix_block as create_matrix_block,
-    create_online_vector as create_vector, create_online_vector_block as create_vector_block)
+    create_online_vector as create_vector, create_online_vector_block as create_vector_block, wrap_online_matrices,
+    wrap_online_vectors)
 
 
 def import_matrix(  # type: ignore[no-any-unimported]
@@ -38,7 +39,7 @@ def import_matrix(  # type: ignore[no-any-unimported]
     :
         Matrix imported from file.
     """
-    return import_matrix_super(lambda: create_matrix(M, N), mpi4py.MPI.COMM_WORLD, directory, filename)
+    return _import_matrix(lambda: create_matrix(M, N), directory, filename)
 
 
 def import_matrix_block(  # type: ignore[no-any-unimported]
@@ -61,7 +62,7 @@ def import_matrix_block(  # type: ignore[no-any-unimported]
     :
         Matrix imported from file.
     """
-    return import_matrix_super(lambda: create_matrix_block(M, N), mpi4py.MPI.COMM_WORLD, directory, filename)
+    return _import_matrix(lambda: create_matrix_block(M, N), directory, filename)
 
 
 def import_matrices(  # type: ignore[no-any-unimported]
@@ -84,7 +85,7 @@ def import_matrices(  # type: ignore[no-any-unimported]
     :
         Matrices imported from file.
     """
-    return import_matrices_super(lambda: create_matrix(M, N), mpi4py.MPI.COMM_WORLD, directory, filename)
+    return _import_matrices(lambda: create_matrix(M, N), (M, N), directory, filename)
 
 
 def import_matrices_block(  # type: ignore[no-any-unimported]
@@ -107,7 +108,7 @@ def import_matrices_block(  # type: ignore[no-any-unimported]
     :
         Matrices imported from file.
     """
-    return import_matrices_super(lambda: create_matrix_block(M, N), mpi4py.MPI.COMM_WORLD, directory, filename)
+    return _import_matrices(lambda: create_matrix_block(M, N), (sum(M), sum(N)), directory, filename)
 
 
 def import_vector(  # type: ignore[no-any-unimported]
@@ -130,7 +131,7 @@ def import_vector(  # type: ignore[no-any-unimported]
     :
         Vector imported from file.
     """
-    return import_vector_super(lambda: create_vector(N), mpi4py.MPI.COMM_WORLD, directory, filename)
+    return _import_vector(lambda: create_vector(N), directory, filename)
 
 
 def import_vector_block(  # type: ignore[no-any-unimported]
@@ -153,7 +154,7 @@ def import_vector_block(  # type: ignore[no-any-unimported]
     :
         Vector imported from file.
     """
-    return import_vector_super(lambda: create_vector_block(N), mpi4py.MPI.COMM_WORLD, directory, filename)
+    return _import_vector(lambda: create_vector_block(N), directory, filename)
 
 
 def import_vectors(  # type: ignore[no-any-unimported]
@@ -176,7 +177,7 @@ def import_vectors(  # type: ignore[no-any-unimported]
     :
         Vectors imported from file.
     """
-    return import_vectors_super(lambda: create_vector(N), mpi4py.MPI.COMM_WORLD, directory, filename)
+    return _import_vectors(lambda: create_vector(N), (N, ), directory, filename)
 
 
 def import_vectors_block(  # type: ignore[no-any-unimported]
@@ -199,4 +200,145 @@ def import_vectors_block(  # type: ignore[no-any-unimported]
     :
         Vectors imported from file.
     """
-    return import_vectors_super(lambda: create_vector_block(N), mpi4py.MPI.COMM_WORLD, directory, filename)
+    return _import_vectors(lambda: create_vector_block(N), (sum(N), ), directory, filename)
+
+
+def _import_matrix(  # type: ignore[no-any-unimported]
+    allocate: typing.Callable[[], petsc4py.PETSc.Mat], directory: str, filename: str
+) -> petsc4py.PETSc.Mat:
+    """
+    Import a dense petsc4py.PETSc.Mat from file.
+
+    The matrix is copied directly from the array stored in a .npy file, if available, and otherwise
+    loaded from a PETSc binary file.
+
+    Parameters
+    ----------
+    allocate
+        A callable to allocate the storage.
+    directory
+        Directory where to import the matrix from.
+    filename
+        Name of the file where to import the matrix from.
+
+    Returns
+    -------
+    :
+        Matrix imported from file.
+    """
+    array = import_array(mpi4py.MPI.COMM_WORLD, directory, filename)
+    if array is not None:
+        mat = allocate()
+        mat.getDenseArray()[:, :] = array
+        mat.assemble()
+        return mat
+    else:
+        return import_matrix_super(allocate, mpi4py.MPI.COMM_WORLD, directory, filename)
+
+
+def _import_matrices(  # type: ignore[no-any-unimported]
+    allocate: typing.Callable[[], petsc4py.PETSc.Mat], shape: typing.Tuple[int, int], directory: str, filename: str
+) -> typing.List[petsc4py.PETSc.Mat]:
+    """
+    Import a list of dense petsc4py.PETSc.Mat from file.
+
+    The matrices are copied from the array stored in a single .npy file, if available, into one contiguous storage
+    shared by all matrices, and otherwise loaded from a PETSc binary file. The shape of each matrix
+    must be provided to validate the content of the .npy file, since allocate is not used in that case.
+
+    Parameters
+    ----------
+    allocate
+        A callable to allocate the storage of each matrix, used when loading from a PETSc binary file.
+    shape
+        Expected shape of each matrix.
+    directory
+        Directory where to import the matrices from.
+    filename
+        Name of the file where to import the matrices from.
+
+    Returns
+    -------
+    :
+        Matrices imported from file.
+    """
+    array = import_array(mpi4py.MPI.COMM_WORLD, directory, filename)
+    if array is not None:
+        if len(array) == 0:
+            return []
+        else:
+            assert array.shape[1:] == shape
+            return wrap_online_matrices(array)
+    else:
+        return import_matrices_super(allocate, mpi4py.MPI.COMM_WORLD, directory, filename)
+
+
+def _import_vector(  # type: ignore[no-any-unimported]
+    allocate: typing.Callable[[], petsc4py.PETSc.Vec], directory: str, filename: str
+) -> petsc4py.PETSc.Vec:
+    """
+    Import a sequential petsc4py.PETSc.Vec from file.
+
+    The vector is copied directly from the array stored in a .npy file, if available, and otherwise
+    loaded from a PETSc binary file.
+
+    Parameters
+    ----------
+    allocate
+        A callable to allocate the storage.
+    directory
+        Directory where to import the vector from.
+    filename
+        Name of the file where to import the vector from.
+
+    Returns
+    -------
+    :
+        Vector imported from file.
+    """
+    array = import_array(mpi4py.MPI.COMM_WORLD, directory, filename)
+    if array is not None:
+        vec = allocate()
+        vec.array[:] = array
+        return vec
+    else:
+        return import_vector_super(allocate, mpi4py.MPI.COMM_WORLD, directory, filename)
+
+
+def _import_vectors(  # type: ignore[no-any-unimported]
+    allocate: typing.Callable[[], petsc4py.PETSc.Vec], shape: typing.Tuple[int], directory: str, filename: str
+) -> typing.List[petsc4py.PETSc.Vec]:
+    """
+    Import a list of sequential petsc4py.PETSc.Vec from file.
+
+    The vectors are wrapped around the array stored in a single .npy file, if available, which provides one
+    contiguous storage shared by all vectors, and otherwise loaded from a PETSc binary file. The shape of each vector
+    must be provided to validate the content of the .npy file, since allocate is not used in that case.
+
+    Parameters
+    ----------
+    allocate
+        A callable to allocate the storage of each vector, used when loading from a PETSc binary file.
+    shape
+        Expected shape of each vector.
+    directory
+        Directory where to import the vectors from.
+    filename
+        Name of the file where to import the vectors from.
+
+    Returns
+    -------
+    :
+        Vectors imported from file.
+    """
+    array = import_array(mpi4py.MPI.COMM_WORLD, directory, filename)
+    if array is not None:
+        if len(array) == 0:
+            return []
+        else:
+            assert array.shape[1:] == shape
+            # The file stores one vector per row: the transpose of the imported array is already column-major,
+            # so that its columns are wrapped into the online vectors without any further copy
+            return wrap_online_vectors(array.T)
+    else:
+        return import_vectors_super(allocate, mpi4py.MPI.COMM_WORLD, directory, filename)
@@ -302,8 +302,10 @@ def _project_matrix_block(  # noqa: F811
         N_a = M_a
     with BlockMatSubMatrixCopier(a, M_a, N_a) as a_copier:
         matrix_action_a = np.zeros((len(N_a), len(M_a)), dtype=object)
+        # Blocks are projected one after the other, hence blocks on the same row can share a work vector
+        a_dot_vec_1 = [create_vector(M_a_i) for M_a_i in M_a]
         for (i, j, a_ij) in a_copier:
-            matrix_action_a[i][j] = matrix_action(a_ij)
+            matrix_action_a[i][j] = matrix_action(a_ij, a_dot_vec_1[i])
         project_matrix_block_super(A, matrix_action_a.tolist(), B)
 
 
@@ -370,7 +372,7 @@ def vector_action(  # type: ignore[no-any-unimported]
 
 
 def matrix_action(  # type: ignore[no-any-unimported]
-    a: petsc4py.PETSc.Mat
+    a: petsc4py.PETSc.Mat, out: typing.Optional[petsc4py.PETSc.Vec] = None
 ) -> typing.Callable[[petsc4py.PETSc.Vec], typing.Callable[[petsc4py.PETSc.Vec], petsc4py.PETSc.ScalarType]]:
     """
     Return a callable that represents the action of a vector-matrix-vector product.
@@ -379,13 +381,21 @@ def matrix_action(  # type: ignore[no-any-unimported]
     ----------
     a
         Matrix representing a bilinear form.
+    out
+        Optional work vector to store the matrix-vector product between a and the trial vector.
+        The same work vector may be shared among several actions, as long as their evaluations are not interleaved.
+        If not provided, a new work vector is allocated.
 
     Returns
     -------
     :
         A callable that represents the action of a on a pair of vectors.
     """
-    a_dot_vec_1 = a.createVecLeft()
+    if out is None:
+        a_dot_vec_1 = a.createVecLeft()
+    else:
+        assert out.size == a.size[0]
+        a_dot_vec_1 = out
 
     def _trial_action(  # type: ignore[no-any-unimported]
         vec_1: petsc4py.PETSc.Vec
@@ -5,39 +5,24 @@
 # SPDX-License-Identifier: LGPL-3.0-or-later
 """Backend to compute the proper orthogonal decomposition of online objects."""
 
-import functools
+import concurrent.futures
+import itertools
+import os
 import typing
 
 import numpy as np
 import numpy.typing
 import petsc4py.PETSc
+import scipy.linalg
 
+from rbnicsx._backends.online_tensors import stack_online_vectors, wrap_online_matrices, wrap_online_vectors
 from rbnicsx._backends.proper_orthogonal_decomposition import (
-    proper_orthogonal_decomposition_functions as proper_orthogonal_decomposition_functions_super,
-    proper_orthogonal_decomposition_functions_block as proper_orthogonal_decomposition_functions_block_super,
-    proper_orthogonal_decomposition_tensors as proper_orthogonal_decomposition_tensors_super)
+    count_retained_modes, fix_eigenvectors_phase, solve_correlation_eigenvalue_problem)
 from rbnicsx.online.functions_list import FunctionsList
-from rbnicsx.online.projection import matrix_action
 from rbnicsx.online.tensors_list import TensorsList
 
 
-@functools.singledispatch
-def _proper_orthogonal_decomposition(  # type: ignore[no-any-unimported]
-    snapshots: typing.Union[FunctionsList, TensorsList], N: int, tol: float, normalize: bool = True
-) -> typing.Tuple[
-    np.typing.NDArray[petsc4py.PETSc.RealType], typing.Union[FunctionsList, TensorsList],
-    typing.List[petsc4py.PETSc.Vec]
-]:
-    """
-    Compute the proper orthogonal decomposition of a set of online snapshots or tensors.
-
-    Please the dispatched implementation for more details.
-    """
-    raise RuntimeError("Please run the dispatched implementation.")
-
-
-@_proper_orthogonal_decomposition.register
-def _(  # type: ignore[no-any-unimported]
+def _proper_orthogonal_decomposition_functions(  # type: ignore[no-any-unimported]
     functions_list: FunctionsList, inner_product: petsc4py.PETSc.Mat, N: int, tol: petsc4py.PETSc.RealType,
     normalize: bool = True
 ) -> typing.Tuple[
@@ -70,10 +55,9 @@ def _(  # type: ignore[no-any-unimported]
             3. Eigenvectors of the correlation matrix. Only the first few eigenvectors are returned, till
                either the maximum number N is reached or the tolerance on the retained energy is fulfilled.
     """
-    compute_inner_product = matrix_action(inner_product)
-
-    return proper_orthogonal_decomposition_functions_super(  # type: ignore[return-value]
-        functions_list, compute_inner_product, _scale_online_vector, N, tol, normalize)
+    snapshots = stack_online_vectors(functions_list)
+    solution = _solve_singular_value_problem(snapshots, inner_product.getDenseArray(), N, tol, normalize)
+    return _wrap_singular_value_problem_solution(functions_list, *solution)
 
 
 def proper_orthogonal_decomposition_block(  # type: ignore[no-any-unimported]
@@ -119,15 +103,40 @@ def proper_orthogonal_decomposition_block(  # type: ignore[no-any-unimported]
                either the maximum number N is reached or the tolerance on the retained energy is fulfilled.
                The outer list collects the eigenvectors of different blocks.
     """
-    compute_inner_products = [matrix_action(inner_product) for inner_product in inner_products]
+    assert len(inner_products) == len(functions_lists)
+    if isinstance(N, list):
+        assert len(N) == len(functions_lists)
+    else:
+        N = [N for _ in functions_lists]
+    if isinstance(tol, list):
+        assert len(tol) == len(functions_lists)
+    else:
+        tol = [tol for _ in functions_lists]
+
+    # Blocks are independent: solve their singular value problems concurrently, since LAPACK releases the GIL.
+    # Data is extracted from (and wrapped back into) petsc4py objects in the main thread only.
+    snapshots = [stack_online_vectors(functions_list) for functions_list in functions_lists]
+    inner_products_arrays = [inner_product.getDenseArray() for inner_product in inner_products]
+    solve_arguments = (snapshots, inner_products_arrays, N, tol, itertools.repeat(normalize))
+    if len(functions_lists) > 1:
+        with concurrent.futures.ThreadPoolExecutor(
+                max_workers=min(len(functions_lists), os.cpu_count() or 1)) as executor:
+            solutions = list(executor.map(_solve_singular_value_problem, *solve_arguments))
+    else:
+        solutions = list(map(_solve_singular_value_problem, *solve_arguments))
 
-    return proper_orthogonal_decomposition_functions_block_super(  # type: ignore[return-value]
-        functions_lists, compute_inner_products, _scale_online_vector, N, tol, normalize)
+    eigenvalues, modes, eigenvectors = list(), list(), list()
+    for (functions_list, solution) in zip(functions_lists, solutions):
+        eigenvalues_, modes_, eigenvectors_ = _wrap_singular_value_problem_solution(functions_list, *solution)
+        eigenvalues.append(eigenvalues_)
+        modes.append(modes_)
+        eigenvectors.append(eigenvectors_)
+    return eigenvalues, modes, eigenvectors
 
 
-@_proper_orthogonal_decomposition.register
-def _(  # type: ignore[no-any-unimported]
-    tensors_list: TensorsList, N: int, tol: petsc4py.PETSc.RealType, normalize: bool = True
+def _proper_orthogonal_decomposition_tensors(  # type: ignore[no-any-unimported]
+    tensors_list: TensorsList, N: int, tol: petsc4py.PETSc.RealType, normalize: bool = True,
+    mixed_precision: bool = False
 ) -> typing.Tuple[
     np.typing.NDArray[petsc4py.PETSc.RealType], TensorsList, typing.List[petsc4py.PETSc.Vec]
 ]:
@@ -144,6 +153,10 @@ def _(  # type: ignore[no-any-unimported]
         Tolerance on the retained energy.
     normalize
         If true (default), the modes are scaled to unit norm.
+    mixed_precision
+        If true, the eigenvalue problem for the correlation matrix is solved in single precision, and the
+        retained eigenpairs are then refined in double precision. If false (default), the eigenvalue problem
+        is solved in double precision.
 
     Returns
     -------
@@ -155,7 +168,19 @@ def _(  # type: ignore[no-any-unimported]
             3. Eigenvectors of the correlation matrix. Only the first few eigenvectors are returned, till
                either the maximum number N is reached or the tolerance on the retained energy is fulfilled.
     """
-    return proper_orthogonal_decomposition_tensors_super(tensors_list, N, tol, normalize)  # type: ignore[return-value]
+    assert tensors_list.type in ("Mat", "Vec")
+    tensors = _stack_tensors(tensors_list)
+    eigenvalues, eigenvectors_array = solve_correlation_eigenvalue_problem(
+        _tensors_correlation_matrix(tensors_list.type, tensors), N, tol, mixed_precision)
+
+    # Combine the tensors for all retained modes at once, and then scale all modes with a single broadcast
+    modes_array = tensors @ eigenvectors_array
+    if normalize:
+        norms = np.linalg.norm(modes_array, axis=0)
+        modes_array[:, norms != 0.0] /= norms[norms != 0.0]
+    modes = tensors_list.duplicate()
+    modes.extend(_unstack_tensors(tensors_list, modes_array))
+    return eigenvalues, modes, wrap_online_vectors(eigenvectors_array)
 
 
 @typing.overload
@@ -171,7 +196,8 @@ def proper_orthogonal_decomposition(  # type: ignore[no-any-unimported]
 
 @typing.overload
 def proper_orthogonal_decomposition(  # type: ignore[no-any-unimported]
-    tensors_list: TensorsList, N: int, tol: petsc4py.PETSc.RealType, normalize: bool = True
+    tensors_list: TensorsList, N: int, tol: petsc4py.PETSc.RealType, normalize: bool = True,
+    mixed_precision: bool = False
 ) -> typing.Tuple[
     np.typing.NDArray[petsc4py.PETSc.RealType], TensorsList, typing.List[petsc4py.PETSc.Vec]
 ]:  # pragma: no cover
@@ -179,13 +205,216 @@ def proper_orthogonal_decomposition(  # type: ignore[no-any-unimported]
     ...
 
 
-def proper_orthogonal_decomposition(*args, **kwargs):  # type: ignore[no-untyped-def]
+def proper_orthogonal_decomposition(snapshots, *args, **kwargs):  # type: ignore[no-untyped-def]
     """Dispatcher of proper_orthogonal_decomposition for type checking. See the concrete implementation above."""
-    return _proper_orthogonal_decomposition(*args, **kwargs)
+    if isinstance(snapshots, FunctionsList):
+        return _proper_orthogonal_decomposition_functions(snapshots, *args, **kwargs)
+    elif isinstance(snapshots, TensorsList):
+        return _proper_orthogonal_decomposition_tensors(snapshots, *args, **kwargs)
+    else:
+        raise RuntimeError("Snapshots must be provided either as a FunctionsList or as a TensorsList.")
+
+
+def _stack_tensors(  # type: ignore[no-any-unimported]
+    tensors_list: TensorsList
+) -> np.typing.NDArray[petsc4py.PETSc.ScalarType]:
+    """
+    Copy the content of a set of online tensors into a dense array.
 
+    Parameters
+    ----------
+    tensors_list
+        Collected tensors.
+
+    Returns
+    -------
+    :
+        Dense array collecting by columns the content of the tensors. Matrices are flattened by rows.
+    """
+    if tensors_list.type == "Mat":
+        return np.column_stack([tensor.getDenseArray().reshape(-1) for tensor in tensors_list])
+    else:
+        return stack_online_vectors(tensors_list)
+
+
+def _unstack_tensors(  # type: ignore[no-any-unimported]
+    tensors_list: TensorsList, array: np.typing.NDArray[petsc4py.PETSc.ScalarType]
+) -> typing.Union[typing.List[petsc4py.PETSc.Mat], typing.List[petsc4py.PETSc.Vec]]:
+    """
+    Wrap the columns of a dense array into new online tensors.
 
-def _scale_online_vector(  # type: ignore[no-any-unimported]
-    vector: petsc4py.PETSc.Vec, factor: petsc4py.PETSc.RealType
-) -> None:
-    """Scale an online petsc4py.PETSc.Vec."""
-    vector *= factor
+    Parameters
+    ----------
+    tensors_list
+        Collected tensors, used as a template for the layout of the new tensors.
+    array
+        Dense array collecting by columns the content of the new tensors, as returned by _stack_tensors.
+
+    Returns
+    -------
+    :
+        New online tensors, sharing their storage with a single copy of the input array.
+    """
+    if tensors_list.type == "Mat":
+        (M, N) = tensors_list[0].getSize()
+        return wrap_online_matrices(array.T.reshape(array.shape[1], M, N))
+    else:
+        return wrap_online_vectors(array)
+
+
+def _tensors_correlation_matrix(  # type: ignore[no-any-unimported]
+    tensors_type: str, tensors: np.typing.NDArray[petsc4py.PETSc.ScalarType]
+) -> np.typing.NDArray[petsc4py.PETSc.ScalarType]:
+    """
+    Assemble the correlation matrix of a set of online tensors with a single matrix-matrix product.
+
+    Parameters
+    ----------
+    tensors_type
+        Type of the tensors, either "Mat" or "Vec".
+    tensors
+        Dense array collecting by columns the content of the tensors, as returned by _stack_tensors.
+
+    Returns
+    -------
+    :
+        Correlation matrix, whose (i, j)-th entry is the Frobenius inner product of the i-th and the j-th tensors.
+    """
+    # The correlation matrix is hermitian: compute only its lower triangle with a rank-k update, and then mirror it.
+    # Vectors are conjugated by a hermitian update in complex arithmetic, while the Frobenius inner product of
+    # matrices is the real part of a symmetric update
+    hermitian = tensors_type == "Vec" and np.iscomplexobj(tensors)
+    rank_k_update = scipy.linalg.get_blas_funcs("herk" if hermitian else "syrk", (tensors, ))
+    correlation_matrix = rank_k_update(1.0, tensors, trans=2 if hermitian else 1, lower=1)
+    if tensors_type == "Mat":
+        correlation_matrix = np.real(correlation_matrix)
+    return np.tril(correlation_matrix) + np.tril(correlation_matrix, -1).conj().T  # type: ignore[no-any-return]
+
+
+def _solve_singular_value_problem(  # type: ignore[no-any-unimported]
+    snapshots: np.typing.NDArray[petsc4py.PETSc.ScalarType],
+    inner_product: np.typing.NDArray[petsc4py.PETSc.ScalarType], N: int, tol: petsc4py.PETSc.RealType,
+    normalize: bool
+) -> typing.Tuple[
+    np.typing.NDArray[petsc4py.PETSc.RealType], np.typing.NDArray[petsc4py.PETSc.ScalarType],
+    np.typing.NDArray[petsc4py.PETSc.ScalarType]
+]:
+    """
+    Compute the proper orthogonal decomposition of a set of online snapshots by a thin singular value decomposition.
+
+    The inner product matrix A is factorized as A = R^H R, so that the correlation matrix X^H A X of the snapshots X
+    is the Gramian of the weighted snapshots R X. The singular value decomposition of R X then provides the
+    eigenpairs of the correlation matrix without assembling it, which would square its condition number.
+    If the inner product matrix is only semidefinite, so that the Cholesky factorization fails, the correlation
+    matrix is assembled and its eigenvalue problem is solved instead.
+    Only numpy arrays are involved, so that this function can be safely called from multiple threads.
+
+    Parameters
+    ----------
+    snapshots
+        Dense array collecting the snapshots by columns.
+    inner_product
+        Dense array of the online matrix which defines the inner product.
+    N
+        Maximum number of modes to be computed.
+    tol
+        Tolerance on the retained energy.
+    normalize
+        If true, the modes are scaled to unit norm.
+
+    Returns
+    -------
+    :
+        A tuple containing:
+            1. Eigenvalues of the correlation matrix, largest first. All computed eigenvalues are returned.
+            2. Dense array collecting by columns the retained modes from the snapshots. Only the first few modes
+               are returned, till either the maximum number N is reached or the tolerance on the retained energy
+               is fulfilled.
+            3. Dense array collecting by columns the eigenvectors of the correlation matrix. Only the first few
+               eigenvectors are returned, till either the maximum number N is reached or the tolerance on the
+               retained energy is fulfilled.
+    """
+    try:
+        cholesky_factor = scipy.linalg.cholesky(inner_product, lower=False)
+    except np.linalg.LinAlgError:
+        eigenvalues, eigenvectors = solve_correlation_eigenvalue_problem(
+            snapshots.T.conj() @ inner_product @ snapshots, N, tol)
+    else:
+        eigenvalues, eigenvectors = _solve_weighted_singular_value_problem(cholesky_factor @ snapshots)
+        eigenvectors = eigenvectors[:, :count_retained_modes(eigenvalues, N, tol)]
+
+    N = eigenvectors.shape[1]
+    modes = snapshots @ eigenvectors
+    if normalize:
+        norms = np.sqrt(np.abs(np.sum(modes.conj() * (inner_product @ modes), axis=0)))
+        modes[:, norms != 0.0] /= norms[norms != 0.0]
+    return eigenvalues, modes, eigenvectors
+
+
+def _solve_weighted_singular_value_problem(  # type: ignore[no-any-unimported]
+    weighted_snapshots: np.typing.NDArray[petsc4py.PETSc.ScalarType]
+) -> typing.Tuple[np.typing.NDArray[petsc4py.PETSc.RealType], np.typing.NDArray[petsc4py.PETSc.ScalarType]]:
+    """
+    Compute all eigenpairs of the correlation matrix by a singular value decomposition of the weighted snapshots.
+
+    Parameters
+    ----------
+    weighted_snapshots
+        Dense array collecting by columns the snapshots premultiplied by the Cholesky factor of the inner product.
+
+    Returns
+    -------
+    :
+        A tuple containing:
+            1. Eigenvalues of the correlation matrix, largest first.
+            2. Dense array collecting by columns all the eigenvectors of the correlation matrix, with their phase
+               fixed as in solve_correlation_eigenvalue_problem.
+    """
+    number_of_snapshots = weighted_snapshots.shape[1]
+
+    # When there are fewer snapshots than online dofs the left singular vectors are never used: replace the
+    # weighted snapshots by the triangular factor of their QR factorization, which has the same singular values and
+    # right singular vectors, so that the singular value decomposition only involves a small square matrix
+    if weighted_snapshots.shape[0] > weighted_snapshots.shape[1]:
+        weighted_snapshots = np.linalg.qr(weighted_snapshots, mode="r")  # type: ignore[assignment]
+
+    # Ask for the full matrix of right singular vectors when there are more snapshots than online dofs,
+    # so that all the eigenvectors of the correlation matrix are available
+    _, singular_values, right_singular_vectors = scipy.linalg.svd(
+        weighted_snapshots, full_matrices=weighted_snapshots.shape[0] < weighted_snapshots.shape[1],
+        lapack_driver="gesdd")
+    eigenvalues = np.zeros(number_of_snapshots)
+    eigenvalues[:len(singular_values)] = singular_values**2
+    return eigenvalues, fix_eigenvectors_phase(right_singular_vectors.T.conj())
+
+
+def _wrap_singular_value_problem_solution(  # type: ignore[no-any-unimported]
+    functions_list: FunctionsList, eigenvalues: np.typing.NDArray[petsc4py.PETSc.RealType],
+    modes_array: np.typing.NDArray[petsc4py.PETSc.ScalarType],
+    eigenvectors_array: np.typing.NDArray[petsc4py.PETSc.ScalarType]
+) -> typing.Tuple[
+    np.typing.NDArray[petsc4py.PETSc.RealType], FunctionsList, typing.List[petsc4py.PETSc.Vec]
+]:
+    """
+    Wrap the dense arrays returned by the singular value problem into online vectors.
+
+    Parameters
+    ----------
+    functions_list
+        Collected snapshots.
+    eigenvalues
+        Eigenvalues of the correlation matrix.
+    modes_array
+        Dense array collecting the retained modes by columns.
+    eigenvectors_array
+        Dense array collecting the retained eigenvectors of the correlation matrix by columns.
+
+    Returns
+    -------
+    :
+        A tuple containing the eigenvalues, the retained modes in a FunctionsList and the retained eigenvectors
+        in a list of online vectors.
+    """
+    modes = functions_list.duplicate()
+    modes.extend(wrap_online_vectors(modes_array))
+    return eigenvalues, modes, wrap_online_vectors(eigenvectors_array)
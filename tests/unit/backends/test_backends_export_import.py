@@ -5,6 +5,7 @@
 # SPDX-License-Identifier: LGPL-3.0-or-later
 """Tests for rbnicsx.backends.export and rbnicsx.backends.import_ modules."""
 
+import os
 import typing
 
 import dolfinx.fem
@@ -19,7 +20,7 @@ import ufl
 import rbnicsx.backends
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def mesh() -> dolfinx.mesh.Mesh:
     """Generate a unit square mesh for use in tests in this file."""
     comm = mpi4py.MPI.COMM_WORLD
@@ -59,6 +60,33 @@ def test_backends_export_import_functions(mesh: dolfinx.mesh.Mesh) -> None:
             assert np.allclose(function2.vector.array, function.vector.array)
 
 
+def test_backends_export_import_functions_one_file_per_entry(mesh: dolfinx.mesh.Mesh) -> None:
+    """Check import of a list of dolfinx.fem.Function exported with one file per entry by earlier versions."""
+    V = dolfinx.fem.FunctionSpace(mesh, ("Lagrange", 1))
+    functions = list()
+    for i in range(2):
+        function = dolfinx.fem.Function(V)
+        function.vector.set(i + 1)
+        functions.append(function)
+
+    with nbvalx.tempfile.TemporaryDirectory(mesh.comm) as tempdir:
+        os.makedirs(os.path.join(tempdir, "functions"), exist_ok=True)
+        if mesh.comm.rank == 0:
+            with open(os.path.join(tempdir, "functions", "length.dat"), "w") as length_file:
+                length_file.write(str(len(functions)))
+        for (index, function) in enumerate(functions):
+            viewer = petsc4py.PETSc.Viewer().createBinary(
+                os.path.join(tempdir, "functions", str(index) + ".dat"), "w", mesh.comm)
+            viewer.view(function.vector)
+            viewer.destroy()
+        mesh.comm.Barrier()
+
+        functions2 = rbnicsx.backends.import_functions(V, tempdir, "functions")
+        assert len(functions2) == 2
+        for (function, function2) in zip(functions, functions2):
+            assert np.allclose(function2.vector.array, function.vector.array)
+
+
 def test_backends_export_import_vector(mesh: dolfinx.mesh.Mesh) -> None:
     """Check I/O for a petsc4py.PETSc.Vec."""
     V = dolfinx.fem.FunctionSpace(mesh, ("Lagrange", 1))
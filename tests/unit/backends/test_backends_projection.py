@@ -19,14 +19,14 @@ import ufl
 import rbnicsx.backends
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def mesh() -> dolfinx.mesh.Mesh:
     """Generate a unit square mesh for use in tests in this file."""
     comm = mpi4py.MPI.COMM_WORLD
     return dolfinx.mesh.create_unit_square(comm, 2 * comm.size, 2 * comm.size)
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def functions_list(mesh: dolfinx.mesh.Mesh) -> rbnicsx.backends.FunctionsList:
     """Generate a rbnicsx.backends.FunctionsList with several entries."""
     V = dolfinx.fem.FunctionSpace(mesh, ("Lagrange", 1))
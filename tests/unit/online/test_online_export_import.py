@@ -5,6 +5,7 @@
 # SPDX-License-Identifier: LGPL-3.0-or-later
 """Tests for rbnicsx.online.export and rbnicsx.online.import_ modules."""
 
+import os
 import typing
 
 import mpi4py.MPI
@@ -12,6 +13,7 @@ import nbvalx.tempfile
 import numpy as np
 import numpy.typing
 import petsc4py.PETSc
+import pytest
 
 import rbnicsx.online
 
@@ -30,6 +32,22 @@ def test_online_export_import_vector() -> None:
         assert np.allclose(vector2.array, vector.array)
 
 
+def test_online_export_import_vector_petsc_binary() -> None:
+    """Check import of an online petsc4py.PETSc.Vec which was exported with a PETSc binary viewer."""
+    vector = rbnicsx.online.create_vector(2)
+    for i in range(2):
+        vector.setValue(i, i + 1)
+    vector.view()
+
+    with nbvalx.tempfile.TemporaryDirectory(mpi4py.MPI.COMM_WORLD) as tempdir:
+        viewer = petsc4py.PETSc.Viewer().createBinary(os.path.join(tempdir, "vector.dat"), "w", mpi4py.MPI.COMM_WORLD)
+        viewer.view(vector)
+        viewer.destroy()
+
+        vector2 = rbnicsx.online.import_vector(2, tempdir, "vector")
+        assert np.allclose(vector2.array, vector.array)
+
+
 def test_online_export_import_vector_block() -> None:
     """Check I/O for an online petsc4py.PETSc.Vec (block version)."""
     vector = rbnicsx.online.create_vector_block([2, 3])
@@ -61,6 +79,41 @@ def test_online_export_import_vectors() -> None:
             assert np.allclose(vector2.array, vector.array)
 
 
+def test_online_export_import_vectors_one_file_per_entry() -> None:
+    """Check import of a list of online petsc4py.PETSc.Vec exported with one file per entry by earlier versions."""
+    vectors = [rbnicsx.online.create_vector(2) for _ in range(3)]
+    for (v, vector) in enumerate(vectors):
+        for i in range(2):
+            vector.setValue(i, v * 2 + i + 1)
+
+    comm = mpi4py.MPI.COMM_WORLD
+    with nbvalx.tempfile.TemporaryDirectory(comm) as tempdir:
+        os.makedirs(os.path.join(tempdir, "vectors"), exist_ok=True)
+        if comm.rank == 0:
+            with open(os.path.join(tempdir, "vectors", "length.dat"), "w") as length_file:
+                length_file.write(str(len(vectors)))
+        for (index, vector) in enumerate(vectors):
+            viewer = petsc4py.PETSc.Viewer().createBinary(
+                os.path.join(tempdir, "vectors", str(index) + ".dat"), "w", comm)
+            viewer.view(vector)
+            viewer.destroy()
+        comm.Barrier()
+
+        vectors2 = rbnicsx.online.import_vectors(2, tempdir, "vectors")
+        assert len(vectors2) == 3
+        for (vector, vector2) in zip(vectors, vectors2):
+            assert np.allclose(vector2.array, vector.array)
+
+
+def test_online_export_import_vectors_empty() -> None:
+    """Check I/O for an empty list of online petsc4py.PETSc.Vec."""
+    with nbvalx.tempfile.TemporaryDirectory(mpi4py.MPI.COMM_WORLD) as tempdir:
+        rbnicsx.online.export_vectors([], tempdir, "vectors")
+
+        vectors2 = rbnicsx.online.import_vectors(2, tempdir, "vectors")
+        assert len(vectors2) == 0
+
+
 def test_online_export_import_vectors_block() -> None:
     """Check I/O for a list of online petsc4py.PETSc.Vec (block version)."""
     vectors = [rbnicsx.online.create_vector_block([2, 3]) for _ in range(3)]
@@ -77,6 +130,31 @@ def test_online_export_import_vectors_block() -> None:
             assert np.allclose(vector2.array, vector.array)
 
 
+def test_online_export_import_vectors_npy() -> None:
+    """Check that a list of online petsc4py.PETSc.Vec is exported to a single .npy file, with one row per entry."""
+    vectors = [rbnicsx.online.create_vector(2) for _ in range(3)]
+    for (v, vector) in enumerate(vectors):
+        for i in range(2):
+            vector.setValue(i, v * 2 + i + 1)
+
+    with nbvalx.tempfile.TemporaryDirectory(mpi4py.MPI.COMM_WORLD) as tempdir:
+        rbnicsx.online.export_vectors(vectors, tempdir, "vectors")
+        assert os.path.isfile(os.path.join(tempdir, "vectors.npy"))
+        assert not os.path.exists(os.path.join(tempdir, "vectors"))
+        array = np.load(os.path.join(tempdir, "vectors.npy"))
+        assert array.shape == (3, 2)
+        for (vector, row) in zip(vectors, array):
+            assert np.allclose(row, vector.array)
+
+        vectors2 = rbnicsx.online.import_vectors(2, tempdir, "vectors")
+        assert len(vectors2) == 3
+        for (vector, vector2) in zip(vectors, vectors2):
+            assert np.allclose(vector2.array, vector.array)
+
+        with pytest.raises(AssertionError):
+            rbnicsx.online.import_vectors(3, tempdir, "vectors")
+
+
 def test_online_export_import_matrix(  # type: ignore[no-any-unimported]
     to_dense_matrix: typing.Callable[[petsc4py.PETSc.Mat], np.typing.NDArray[petsc4py.PETSc.ScalarType]]
 ) -> None:
@@ -95,6 +173,26 @@ def test_online_export_import_matrix(  # type: ignore[no-any-unimported]
         assert np.allclose(to_dense_matrix(matrix2), to_dense_matrix(matrix))
 
 
+def test_online_export_import_matrix_petsc_binary(  # type: ignore[no-any-unimported]
+    to_dense_matrix: typing.Callable[[petsc4py.PETSc.Mat], np.typing.NDArray[petsc4py.PETSc.ScalarType]]
+) -> None:
+    """Check import of an online petsc4py.PETSc.Mat which was exported with a PETSc binary viewer."""
+    matrix = rbnicsx.online.create_matrix(2, 3)
+    for i in range(2):
+        for j in range(3):
+            matrix.setValue(i, j, i * 3 + j + 1)
+    matrix.assemble()
+    matrix.view()
+
+    with nbvalx.tempfile.TemporaryDirectory(mpi4py.MPI.COMM_WORLD) as tempdir:
+        viewer = petsc4py.PETSc.Viewer().createBinary(os.path.join(tempdir, "matrix.dat"), "w", mpi4py.MPI.COMM_WORLD)
+        viewer.view(matrix)
+        viewer.destroy()
+
+        matrix2 = rbnicsx.online.import_matrix(2, 3, tempdir, "matrix")
+        assert np.allclose(to_dense_matrix(matrix2), to_dense_matrix(matrix))
+
+
 def test_online_export_import_matrix_block(  # type: ignore[no-any-unimported]
     to_dense_matrix: typing.Callable[[petsc4py.PETSc.Mat], np.typing.NDArray[petsc4py.PETSc.ScalarType]]
 ) -> None:
@@ -133,6 +231,45 @@ def test_online_export_import_matrices(  # type: ignore[no-any-unimported]
             assert np.allclose(to_dense_matrix(matrix2), to_dense_matrix(matrix))
 
 
+def test_online_export_import_matrices_empty() -> None:
+    """Check I/O for an empty list of online petsc4py.PETSc.Mat."""
+    with nbvalx.tempfile.TemporaryDirectory(mpi4py.MPI.COMM_WORLD) as tempdir:
+        rbnicsx.online.export_matrices([], tempdir, "matrices")
+
+        matrices2 = rbnicsx.online.import_matrices(2, 3, tempdir, "matrices")
+        assert len(matrices2) == 0
+
+
+def test_online_export_import_matrices_one_file_per_entry(  # type: ignore[no-any-unimported]
+    to_dense_matrix: typing.Callable[[petsc4py.PETSc.Mat], np.typing.NDArray[petsc4py.PETSc.ScalarType]]
+) -> None:
+    """Check import of a list of online petsc4py.PETSc.Mat exported with one file per entry by earlier versions."""
+    matrices = [rbnicsx.online.create_matrix(2, 3) for _ in range(4)]
+    for (m, matrix) in enumerate(matrices):
+        for i in range(2):
+            for j in range(3):
+                matrix.setValue(i, j, m * 6 + i * 3 + j + 1)
+        matrix.assemble()
+
+    comm = mpi4py.MPI.COMM_WORLD
+    with nbvalx.tempfile.TemporaryDirectory(comm) as tempdir:
+        os.makedirs(os.path.join(tempdir, "matrices"), exist_ok=True)
+        if comm.rank == 0:
+            with open(os.path.join(tempdir, "matrices", "length.dat"), "w") as length_file:
+                length_file.write(str(len(matrices)))
+        for (index, matrix) in enumerate(matrices):
+            viewer = petsc4py.PETSc.Viewer().createBinary(
+                os.path.join(tempdir, "matrices", str(index) + ".dat"), "w", comm)
+            viewer.view(matrix)
+            viewer.destroy()
+        comm.Barrier()
+
+        matrices2 = rbnicsx.online.import_matrices(2, 3, tempdir, "matrices")
+        assert len(matrices2) == 4
+        for (matrix, matrix2) in zip(matrices, matrices2):
+            assert np.allclose(to_dense_matrix(matrix2), to_dense_matrix(matrix))
+
+
 def test_online_export_import_matrices_block(  # type: ignore[no-any-unimported]
     to_dense_matrix: typing.Callable[[petsc4py.PETSc.Mat], np.typing.NDArray[petsc4py.PETSc.ScalarType]]
 ) -> None:
@@ -151,3 +288,32 @@ def test_online_export_import_matrices_block(  # type: ignore[no-any-unimported]
         matrices2 = rbnicsx.online.import_matrices_block([2, 3], [4, 5], tempdir, "matrices")
         for (matrix, matrix2) in zip(matrices, matrices2):
             assert np.allclose(to_dense_matrix(matrix2), to_dense_matrix(matrix))
+
+
+def test_online_export_import_matrices_npy(  # type: ignore[no-any-unimported]
+    to_dense_matrix: typing.Callable[[petsc4py.PETSc.Mat], np.typing.NDArray[petsc4py.PETSc.ScalarType]]
+) -> None:
+    """Check that a list of online petsc4py.PETSc.Mat is exported to a single .npy file, with one slice per entry."""
+    matrices = [rbnicsx.online.create_matrix(2, 3) for _ in range(4)]
+    for (m, matrix) in enumerate(matrices):
+        for i in range(2):
+            for j in range(3):
+                matrix.setValue(i, j, m * 6 + i * 3 + j + 1)
+        matrix.assemble()
+
+    with nbvalx.tempfile.TemporaryDirectory(mpi4py.MPI.COMM_WORLD) as tempdir:
+        rbnicsx.online.export_matrices(matrices, tempdir, "matrices")
+        assert os.path.isfile(os.path.join(tempdir, "matrices.npy"))
+        assert not os.path.exists(os.path.join(tempdir, "matrices"))
+        array = np.load(os.path.join(tempdir, "matrices.npy"))
+        assert array.shape == (4, 2, 3)
+        for (matrix, slice_) in zip(matrices, array):
+            assert np.allclose(slice_, to_dense_matrix(matrix))
+
+        matrices2 = rbnicsx.online.import_matrices(2, 3, tempdir, "matrices")
+        assert len(matrices2) == 4
+        for (matrix, matrix2) in zip(matrices, matrices2):
+            assert np.allclose(to_dense_matrix(matrix2), to_dense_matrix(matrix))
+
+        with pytest.raises(AssertionError):
+            rbnicsx.online.import_matrices(3, 2, tempdir, "matrices")
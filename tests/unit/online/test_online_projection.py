@@ -204,3 +204,22 @@ def test_online_projection_matrix_block_petrov_galerkin(  # type: ignore[no-any-
     rbnicsx.online.project_matrix_block(online_mat2, 0.6 * bilinear_form_block, basis_vectors)
     assert online_mat2.size == (5, 9)
     assert np.allclose(to_dense_matrix(online_mat2), to_dense_matrix(online_mat))
+
+
+def test_online_projection_matrix_action_interleaved(  # type: ignore[no-any-unimported]
+    bilinear_form: petsc4py.PETSc.Mat
+) -> None:
+    """Test that actions of the same matrix obtained from separate calls do not share their work vector."""
+    u = rbnicsx.online.create_vector(30)
+    v = rbnicsx.online.create_vector(30)
+    w = rbnicsx.online.create_vector(30)
+    for i in range(30):
+        u.setValue(i, 1)
+        v.setValue(i, 2 * (i + 1))
+        w.setValue(i, i + 1)
+    f = rbnicsx.online.matrix_action(bilinear_form)(u)
+    g = rbnicsx.online.matrix_action(bilinear_form)(v)
+    sum_squares_first_30_numbers = 30 * 31 * 61 / 6
+    sum_cubes_first_30_numbers = 30**2 * 31**2 / 4
+    assert np.isclose(f(w), sum_squares_first_30_numbers)
+    assert np.isclose(g(w), 2 * sum_cubes_first_30_numbers)
@@ -189,6 +189,72 @@ def test_online_proper_orthogonal_decomposition_functions_tol(  # type: ignore[n
     assert len(eigenvectors) == 1
 
 
+@pytest.mark.parametrize("normalize", [True, False])
+def test_online_proper_orthogonal_decomposition_functions_semidefinite(  # type: ignore[no-any-unimported]
+    functions_list: rbnicsx.online.FunctionsList, inner_product: typing.Callable[[int], petsc4py.PETSc.Mat],
+    normalize: bool
+) -> None:
+    """
+    Check rbnicsx.online.proper_orthogonal_decomposition for the case of snapshots stored in a FunctionsList.
+
+    The case of a singular inner product matrix, which does not admit a Cholesky factorization, is tested here.
+    """
+    size = functions_list[0].size
+    inner_product_matrix = inner_product(size)
+    inner_product_matrix.setValue(2, 2, 0)
+    inner_product_matrix.assemble()
+    eigenvalues, modes, eigenvectors = rbnicsx.online.proper_orthogonal_decomposition(
+        functions_list[:2], inner_product_matrix, N=2, tol=0.0, normalize=normalize)
+    assert len(eigenvalues) == 2
+    sum_squares_first_size_numbers_but_third = size * (size + 1) * (2 * size + 1) / 6 - 9
+    assert np.isclose(eigenvalues[0], 5 * sum_squares_first_size_numbers_but_third)
+    assert np.isclose(eigenvalues[1], 0)
+    assert len(modes) == 2
+    assert np.isclose(
+        compute_inner_product(inner_product_matrix, modes[0], modes[0]),
+        1 if normalize else 5 * sum_squares_first_size_numbers_but_third)
+    if normalize:
+        assert np.allclose(
+            modes[0].array, 1 / np.sqrt(sum_squares_first_size_numbers_but_third) * np.arange(1, size + 1))
+    assert len(eigenvectors) == 2
+
+
+@pytest.mark.parametrize("normalize", [True, False])
+@pytest.mark.parametrize("inner_product_diagonal", [[1, 2, 3], [1, 1, 0]])
+def test_online_proper_orthogonal_decomposition_functions_independent(
+    normalize: bool, inner_product_diagonal: typing.List[int]
+) -> None:
+    """
+    Check rbnicsx.online.proper_orthogonal_decomposition for the case of snapshots stored in a FunctionsList.
+
+    The case of linearly independent snapshots is tested here, so that all modes are meaningful.
+    """
+    inner_product_matrix = rbnicsx.online.create_matrix(3, 3)
+    for (i, inner_product_diagonal_i) in enumerate(inner_product_diagonal):
+        inner_product_matrix.setValue(i, i, inner_product_diagonal_i)
+    inner_product_matrix.assemble()
+    functions_list = rbnicsx.online.FunctionsList(3)
+    for values in ([1, 2, 3], [3, 1, 2]):
+        vector = rbnicsx.online.create_vector(3)
+        for (i, value) in enumerate(values):
+            vector.setValue(i, value)
+        functions_list.append(vector)
+    eigenvalues, modes, eigenvectors = rbnicsx.online.proper_orthogonal_decomposition(
+        functions_list, inner_product_matrix, N=2, tol=0.0, normalize=normalize)
+    assert len(eigenvalues) == 2
+    assert eigenvalues[0] > eigenvalues[1] > 0
+    assert np.isclose(
+        sum(eigenvalues), sum(compute_inner_product(inner_product_matrix, function, function)
+                              for function in functions_list))
+    assert len(modes) == 2
+    for i in range(2):
+        for j in range(2):
+            assert np.isclose(
+                compute_inner_product(inner_product_matrix, modes[i], modes[j]),
+                (1 if normalize else eigenvalues[i]) if i == j else 0)
+    assert len(eigenvectors) == 2
+
+
 @pytest.mark.parametrize("normalize", [True, False])
 @pytest.mark.parametrize(
     "stopping_criterion_generator",
@@ -228,6 +294,14 @@ def test_online_proper_orthogonal_decomposition_block(  # type: ignore[no-any-un
         assert len(eigenvectors[component]) == 2
 
 
+def test_online_proper_orthogonal_decomposition_block_empty() -> None:
+    """Check rbnicsx.online.proper_orthogonal_decomposition_block for the case of no blocks."""
+    eigenvalues, modes, eigenvectors = rbnicsx.online.proper_orthogonal_decomposition_block([], [], N=2, tol=0.0)
+    assert eigenvalues == []
+    assert modes == []
+    assert eigenvectors == []
+
+
 @pytest.mark.parametrize("normalize", [True, False])
 def test_online_proper_orthogonal_decomposition_vectors(
     tensors_list_vec: rbnicsx.online.TensorsList, normalize: bool
@@ -244,6 +318,19 @@ def test_online_proper_orthogonal_decomposition_vectors(
     assert len(eigenvectors) == 2
 
 
+def test_online_proper_orthogonal_decomposition_vectors_eigenvectors(
+    tensors_list_vec: rbnicsx.online.TensorsList
+) -> None:
+    """Check that modes combine petsc4py.PETSc.Vec snapshots with the entries of the eigenvectors, with fixed phase."""
+    _, modes, eigenvectors = rbnicsx.online.proper_orthogonal_decomposition(
+        tensors_list_vec, N=2, tol=0.0, normalize=False)
+    for (mode, eigenvector) in zip(modes, eigenvectors):
+        assert np.allclose(
+            mode.array, sum(eigenvector.array[i] * tensor.array for (i, tensor) in enumerate(tensors_list_vec)))
+        largest_entry = eigenvector.array[np.argmax(np.abs(eigenvector.array))]
+        assert np.isclose(largest_entry, abs(largest_entry))
+
+
 @pytest.mark.parametrize("normalize", [True, False])
 def test_online_proper_orthogonal_decomposition_matrices(
     tensors_list_mat: rbnicsx.online.TensorsList, normalize: bool
@@ -260,6 +347,46 @@ def test_online_proper_orthogonal_decomposition_matrices(
     assert len(eigenvectors) == 2
 
 
+def test_online_proper_orthogonal_decomposition_vectors_mixed_precision(
+    tensors_list_vec: rbnicsx.online.TensorsList
+) -> None:
+    """Check rbnicsx.online.proper_orthogonal_decomposition for petsc4py.PETSc.Vec snapshots in mixed precision."""
+    eigenvalues, modes, eigenvectors = rbnicsx.online.proper_orthogonal_decomposition(
+        tensors_list_vec, N=2, tol=0.0)
+    eigenvalues_mixed, modes_mixed, eigenvectors_mixed = rbnicsx.online.proper_orthogonal_decomposition(
+        tensors_list_vec, N=2, tol=0.0, mixed_precision=True)
+    assert len(eigenvalues_mixed) == 2
+    assert np.isclose(eigenvalues_mixed[0], eigenvalues[0])
+    assert np.isclose(eigenvalues_mixed[1], 0, atol=1e-4 * eigenvalues[0])
+    assert len(modes_mixed) == 2
+    assert np.isclose(abs(modes_mixed[0].dot(modes[0])), 1)
+    assert len(eigenvectors_mixed) == 2
+    assert np.isclose(abs(eigenvectors_mixed[0].dot(eigenvectors[0])), 1)
+    for i in range(2):
+        for j in range(2):
+            assert np.isclose(eigenvectors_mixed[i].dot(eigenvectors_mixed[j]), 1 if i == j else 0)
+
+
+def test_online_proper_orthogonal_decomposition_matrices_mixed_precision(
+    tensors_list_mat: rbnicsx.online.TensorsList
+) -> None:
+    """Check rbnicsx.online.proper_orthogonal_decomposition for petsc4py.PETSc.Mat snapshots in mixed precision."""
+    eigenvalues, modes, eigenvectors = rbnicsx.online.proper_orthogonal_decomposition(
+        tensors_list_mat, N=2, tol=0.0)
+    eigenvalues_mixed, modes_mixed, eigenvectors_mixed = rbnicsx.online.proper_orthogonal_decomposition(
+        tensors_list_mat, N=2, tol=0.0, mixed_precision=True)
+    assert len(eigenvalues_mixed) == 2
+    assert np.isclose(eigenvalues_mixed[0], eigenvalues[0])
+    assert np.isclose(eigenvalues_mixed[1], 0, atol=1e-4 * eigenvalues[0])
+    assert len(modes_mixed) == 2
+    assert np.isclose(abs(np.vdot(modes[0].getDenseArray(), modes_mixed[0].getDenseArray())), 1)
+    assert len(eigenvectors_mixed) == 2
+    assert np.isclose(abs(eigenvectors_mixed[0].dot(eigenvectors[0])), 1)
+    for i in range(2):
+        for j in range(2):
+            assert np.isclose(eigenvectors_mixed[i].dot(eigenvectors_mixed[j]), 1 if i == j else 0)
+
+
 @pytest.mark.parametrize("normalize", [True, False])
 def test_online_proper_orthogonal_decomposition_zero(  # type: ignore[no-any-unimported]
     inner_product: typing.Callable[[int], petsc4py.PETSc.Mat], normalize: bool
@@ -94,6 +94,23 @@ def test_online_vector_block_set() -> None:
             assert online_vec[blocks[I] + i] == (I + 1) * 10 + (i + 1)
 
 
+def test_online_vectors_stack_wrap() -> None:
+    """Stack online vectors into a dense array and wrap the array back into online vectors."""
+    online_vecs = [rbnicsx.online.create_vector(2) for _ in range(3)]
+    for (v, online_vec) in enumerate(online_vecs):
+        for i in range(2):
+            online_vec.setValue(i, v * 2 + i + 1)
+    array = rbnicsx.online.stack_vectors(online_vecs)
+    assert array.shape == (2, 3)
+    assert np.allclose(array, np.arange(1, 7).reshape(3, 2).T)
+    wrapped_vecs = rbnicsx.online.wrap_vectors(array)
+    assert len(wrapped_vecs) == 3
+    for (online_vec, wrapped_vec) in zip(online_vecs, wrapped_vecs):
+        assert wrapped_vec.size == 2
+        assert np.allclose(wrapped_vec.array, online_vec.array)
+        assert wrapped_vec.getLGMap().getIndices().tolist() == [0, 1]
+
+
 def test_online_matrix_set() -> None:
     """Set some entries in the created online matrix."""
     online_mat = rbnicsx.online.create_matrix(2, 3)
@@ -107,6 +124,21 @@ def test_online_matrix_set() -> None:
             assert online_mat[i, j] == i * 3 + j + 1
 
 
+def test_online_matrices_wrap() -> None:
+    """Wrap a three-dimensional dense array into online matrices."""
+    array = np.arange(1, 13, dtype=petsc4py.PETSc.ScalarType).reshape(2, 2, 3)
+    wrapped_mats = rbnicsx.online.wrap_matrices(array)
+    assert len(wrapped_mats) == 2
+    for (k, wrapped_mat) in enumerate(wrapped_mats):
+        assert wrapped_mat.getType() == petsc4py.PETSc.Mat.Type.SEQDENSE
+        assert wrapped_mat.size == (2, 3)
+        for i in range(2):
+            for j in range(3):
+                assert wrapped_mat[i, j] == array[k, i, j]
+        assert wrapped_mat.getLGMap()[0].getIndices().tolist() == [0, 1]
+        assert wrapped_mat.getLGMap()[1].getIndices().tolist() == [0, 1, 2]
+
+
 def test_online_matrix_set_local() -> None:
     """Set some entries in the created online matrix using the local setter."""
     online_mat = rbnicsx.online.create_matrix(2, 3)